@@ -12,7 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-"""Per-instance method caching.
+"""Per-instance method and property caching.
 
 :func:`lru_cached_method` is the per-instance counterpart of
 ``functools.lru_cache``: the cache (and its condition) live on the instance, so
@@ -20,14 +20,88 @@ they are released together with the instance instead of being pinned on the
 class for the lifetime of the process. The caching itself is delegated to
 ``cachetools.cachedmethod``; this only lazily creates the instance's cache and
 condition.
+
+:class:`cached_property` is a lock-free variant of
+``functools.cached_property`` for properties accessed in the tile hot path.
 """
 
 import threading
-from typing import Any, Callable, Optional, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 from cachetools import LRUCache, cachedmethod
 
 F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+_NOT_FOUND = object()
+
+if TYPE_CHECKING:
+    # Present the descriptor to type checkers as a plain property: the access
+    # type is inferred from the decorated function, and overriding the
+    # abstract properties in the image base classes is accepted (pyright
+    # rejects any non-property descriptor, including
+    # functools.cached_property, as a property override).
+    cached_property = property
+else:
+
+    class cached_property(Generic[T]):  # noqa: N801
+        """Cache a property's value in the instance's ``__dict__``.
+
+        Drop-in replacement for ``functools.cached_property`` without the lock
+        that Python < 3.12 holds while computing the value, which serializes
+        threads first-touching any cached property of the same class. If
+        threads race on the first access the function may run more than once
+        and one result is kept -- acceptable for the side-effect free
+        properties cached here, and the same trade-off CPython adopted when
+        removing the lock in 3.12.
+        """
+
+        def __init__(self, func: Callable[[Any], T]) -> None:
+            self.func = func
+            self.attrname: Optional[str] = None
+            self.__doc__ = func.__doc__
+
+        def __set_name__(self, owner: type, name: str) -> None:
+            if self.attrname is None:
+                self.attrname = name
+            elif name != self.attrname:
+                raise TypeError(
+                    "Cannot assign the same cached_property to two different "
+                    f"names ({self.attrname!r} and {name!r})."
+                )
+
+        @overload
+        def __get__(
+            self, instance: None, owner: Optional[type] = None
+        ) -> "cached_property[T]": ...
+
+        @overload
+        def __get__(self, instance: object, owner: Optional[type] = None) -> T: ...
+
+        def __get__(
+            self, instance: Optional[object], owner: Optional[type] = None
+        ) -> Union["cached_property[T]", T]:
+            if instance is None:
+                return self
+            if self.attrname is None:
+                raise TypeError(
+                    "Cannot use cached_property instance without calling "
+                    "__set_name__ on it."
+                )
+            value = instance.__dict__.get(self.attrname, _NOT_FOUND)
+            if value is _NOT_FOUND:
+                value = instance.__dict__[self.attrname] = self.func(instance)
+            return cast(T, value)
 
 
 def lru_cached_method(
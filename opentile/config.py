@@ -14,6 +14,8 @@
 
 """General settings."""
 
+import os
+
 
 class Settings:
     """Class containing settings. Settings are to be accessed through the
@@ -21,6 +23,8 @@ class Settings:
 
     def __init__(self) -> None:
         self._ndpi_frame_cache = 128
+        self._tile_worker_threads = os.cpu_count() or 1
+        self._use_memory_mapping = True
 
     @property
     def ndpi_frame_cache(self) -> int:
@@ -31,6 +35,25 @@ class Settings:
     def ndpi_frame_cache(self, value: int) -> None:
         self._ndpi_frame_cache = value
 
+    @property
+    def tile_worker_threads(self) -> int:
+        """Number of threads used for producing multiple tiles."""
+        return self._tile_worker_threads
+
+    @tile_worker_threads.setter
+    def tile_worker_threads(self, value: int) -> None:
+        self._tile_worker_threads = value
+
+    @property
+    def use_memory_mapping(self) -> bool:
+        """Whether to serve local file reads through a read-only memory map
+        when possible, instead of read syscalls per frame."""
+        return self._use_memory_mapping
+
+    @use_memory_mapping.setter
+    def use_memory_mapping(self, value: bool) -> None:
+        self._use_memory_mapping = value
+
 
 settings = Settings()
 """Global settings variable."""
@@ -14,10 +14,14 @@
 
 """Wrapper around a TiffFile to provide thread safe access to the file handle."""
 
+import mmap
 import os
 import queue
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
 from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from types import TracebackType
@@ -29,10 +33,18 @@ from fsspec.implementations.local import LocalFileSystem
 from tifffile import TiffFile, TiffFileError, TiffPages, TiffPageSeries
 from upath import UPath
 
+from opentile.cache import cached_property
+from opentile.config import settings
+
 # Open local files for sequential read-ahead via FILE_FLAG_SEQUENTIAL_SCAN on
 # Windows (O_SEQUENTIAL); other platforms rely on the kernel's default readahead.
 _READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
 
+# Positional reads save the seek syscall and leave the handle's file position
+# untouched. Not available on Windows.
+_HAS_PREAD = hasattr(os, "pread")
+_HAS_PREADV = hasattr(os, "preadv")
+
 
 class FrameReader(ABC):
     """Reads frame bytes at absolute offsets."""
@@ -94,18 +106,103 @@ class FileHandlePool:
         return handle
 
 
+class BufferPool:
+    """A bounded pool of reusable bytearrays, bucketed by power-of-two size.
+
+    Coalesced reads allocate a transient buffer per run and drop it as soon as
+    the frames have been sliced out; recycling those buffers keeps the
+    allocator out of the tile read loop. `acquire()` returns a buffer of at
+    least the requested size, `release()` returns it for reuse. Buckets are
+    capped so idle buffers do not accumulate without bound."""
+
+    _MAX_PER_BUCKET = 8
+
+    def __init__(self) -> None:
+        self._buckets: defaultdict[int, deque[bytearray]] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def acquire(self, nbytes: int) -> bytearray:
+        """Return a buffer of at least `nbytes`, reusing a released one if the
+        matching bucket has one."""
+        size = 1 << max(nbytes - 1, 0).bit_length()
+        with self._lock:
+            bucket = self._buckets[size]
+            if bucket:
+                return bucket.pop()
+        return bytearray(size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer to its bucket for reuse, unless the bucket is full."""
+        with self._lock:
+            bucket = self._buckets[len(buffer)]
+            if len(bucket) < self._MAX_PER_BUCKET:
+                bucket.append(buffer)
+
+
 class LocalFileReader(FrameReader):
-    """Reads a local file through a pool of raw handles with OS read-ahead."""
+    """Reads a local file through a read-only memory map, falling back to a
+    pool of raw handles with OS read-ahead when mapping is disabled or
+    unavailable."""
 
     def __init__(self, path: str) -> None:
         self._pool = FileHandlePool(path)
+        self._buffers = BufferPool()
+        self._mmap: Optional[mmap.mmap] = None
+        self._mmap_failed = False
+        self._mmap_lock = threading.Lock()
+
+    def _get_mmap(self) -> Optional[mmap.mmap]:
+        """Return a read-only memory map of the file, created on first use.
+        Mapping the file once replaces the read syscall per frame with page
+        cache access. Returns None if mapping is disabled or failed (e.g.
+        empty file or no address space); a failure falls back to positional
+        reads permanently."""
+        if not settings.use_memory_mapping:
+            return None
+        if self._mmap is not None or self._mmap_failed:
+            return self._mmap
+        with self._mmap_lock:
+            if self._mmap is None and not self._mmap_failed:
+                try:
+                    with self._pool.acquire() as handle:
+                        self._mmap = mmap.mmap(
+                            handle.fileno(), 0, access=mmap.ACCESS_READ
+                        )
+                except (ValueError, OSError):
+                    self._mmap_failed = True
+        return self._mmap
 
     @staticmethod
     def _read_at(handle: BinaryIO, offset: int, bytecount: int) -> bytes:
+        if _HAS_PREAD:
+            return os.pread(handle.fileno(), bytecount, offset)
         handle.seek(offset)
         return handle.read(bytecount)
 
+    @staticmethod
+    def _read_at_into(handle: BinaryIO, offset: int, view: memoryview) -> None:
+        """Read into `view` at `offset`. The handles are unbuffered, so a
+        single read may return short; loop until the view is filled."""
+        filled = 0
+        if _HAS_PREADV:
+            fd = handle.fileno()
+            while filled < len(view):
+                count = os.preadv(fd, [view[filled:]], offset + filled)
+                if not count:
+                    break
+                filled += count
+            return
+        handle.seek(offset)
+        while filled < len(view):
+            count = handle.readinto(view[filled:])  # type: ignore[attr-defined]
+            if not count:
+                break
+            filled += count
+
     def read(self, offset: int, bytecount: int) -> bytes:
+        mapped = self._get_mmap()
+        if mapped is not None:
+            return mapped[offset : offset + bytecount]
         with self._pool.acquire() as handle:
             return self._read_at(handle, offset, bytecount)
 
@@ -113,31 +210,53 @@ class LocalFileReader(FrameReader):
         self, offsets_bytecounts: Sequence[tuple[int, int]]
     ) -> list[bytes]:
         """Coalesce contiguous reads into a single read and slice them apart."""
+        mapped = self._get_mmap()
+        if mapped is not None:
+            # The page cache serves random access directly; no coalescing
+            # needed.
+            return [
+                mapped[offset : offset + bytecount]
+                for offset, bytecount in offsets_bytecounts
+            ]
         if len(offsets_bytecounts) == 1:
             offset, bytecount = offsets_bytecounts[0]
             return [self.read(offset, bytecount)]
         with self._pool.acquire() as handle:
             result = [b""] * len(offsets_bytecounts)
-            for run in self._contiguous_runs(offsets_bytecounts):
+            for run in self._coalesced_runs(offsets_bytecounts):
                 start = offsets_bytecounts[run[0]][0]
                 last_offset, last_bytecount = offsets_bytecounts[run[-1]]
-                blob = self._read_at(
-                    handle, start, last_offset + last_bytecount - start
-                )
+                length = last_offset + last_bytecount - start
                 if len(run) == 1:
-                    # The blob is exactly the frame; return it without a copy.
-                    result[run[0]] = blob
+                    # The read is exactly the frame; return it without a copy.
+                    result[run[0]] = self._read_at(handle, start, length)
                     continue
-                for index in run:
-                    offset, bytecount = offsets_bytecounts[index]
-                    result[index] = blob[offset - start : offset - start + bytecount]
+                # Read the run into a pooled buffer that is recycled once the
+                # frames have been sliced out.
+                buffer = self._buffers.acquire(length)
+                with memoryview(buffer) as view:
+                    self._read_at_into(handle, start, view[:length])
+                    for index in run:
+                        offset, bytecount = offsets_bytecounts[index]
+                        result[index] = bytes(
+                            view[offset - start : offset - start + bytecount]
+                        )
+                self._buffers.release(buffer)
             return result
 
-    @staticmethod
-    def _contiguous_runs(
+    # Nearby frames are coalesced into one read when the gap between them is
+    # at most this many bytes; reading a small gap is cheaper than the extra
+    # syscall for a separate read.
+    _MAX_COALESCE_GAP = 64 * 1024
+
+    @classmethod
+    def _coalesced_runs(
+        cls,
         offsets_bytecounts: Sequence[tuple[int, int]],
     ) -> list[list[int]]:
-        """Group contiguous frames into runs of original indices, in offset order."""
+        """Group nearby frames into runs of original indices, in offset order.
+        Frames separated by at most `_MAX_COALESCE_GAP` bytes are read as one
+        run; the gap bytes are read and discarded."""
         in_offset_order = sorted(
             range(len(offsets_bytecounts)),
             key=lambda index: offsets_bytecounts[index][0],
@@ -146,7 +265,7 @@ class LocalFileReader(FrameReader):
         previous_end = -1
         for index in in_offset_order:
             offset, bytecount = offsets_bytecounts[index]
-            if runs and offset == previous_end:
+            if runs and 0 <= offset - previous_end <= cls._MAX_COALESCE_GAP:
                 runs[-1].append(index)
             else:
                 runs.append([index])
@@ -154,6 +273,8 @@ class LocalFileReader(FrameReader):
         return runs
 
     def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
         self._pool.close()
 
 
@@ -201,6 +322,8 @@ class OpenTileFile:
         )
         self._tiff_file = self._open_tiff_file(fs, path)
         self._frame_reader = self._create_frame_reader(fs, path)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
 
     def _open_tiff_file(self, fs: AbstractFileSystem, path: str) -> TiffFile:
         """Open and parse the file as a TiffFile, closing the handle on error."""
@@ -237,11 +360,23 @@ class OpenTileFile:
         """Return the series in the TiffFile."""
         return self._tiff_file.series
 
-    @property
+    @cached_property
     def filepath(self) -> UPath:
         """Return the path to the file."""
         return UPath(self._file, **self._options)
 
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Return the thread pool shared by the file's images for per-tile
+        work, created on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=settings.tile_worker_threads
+                    )
+        return self._pool
+
     def read(self, offset: int, bytecount: int) -> bytes:
         """Return bytes from single location from file. Is thread safe."""
         return self._frame_reader.read(offset, bytecount)
@@ -254,6 +389,8 @@ class OpenTileFile:
 
     def close(self) -> None:
         """Close the reader and the TiffFile."""
+        if self._pool is not None:
+            self._pool.shutdown()
         self._frame_reader.close()
         self._tiff_file.close()
 
@@ -18,6 +18,7 @@ from typing import Optional
 
 from tifffile import COMPRESSION, PHOTOMETRIC, TiffPage
 
+from opentile.cache import cached_property
 from opentile.file import OpenTileFile
 from opentile.geometry import Size, SizeMm
 from opentile.tiff_image import LevelTiffImage, NativeTiledTiffImage
@@ -45,7 +46,7 @@ class HistechTiffImage(NativeTiledTiffImage, LevelTiffImage):
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._page}, {self._file}, {self._base_size})"
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self.mpp / 1000
 
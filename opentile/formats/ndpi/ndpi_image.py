@@ -16,14 +16,13 @@
 
 from abc import abstractmethod
 from collections.abc import Iterator, Sequence
-from functools import cached_property
 from typing import Optional
 
 import numpy as np
 from imagecodecs import jpeg8_decode
 from tifffile import COMPRESSION, RESUNIT, TiffPage
 
-from opentile.cache import lru_cached_method
+from opentile.cache import cached_property, lru_cached_method
 from opentile.config import settings
 from opentile.file import OpenTileFile
 from opentile.formats.ndpi.ndpi_tile import NdpiFrameJob, NdpiTile
@@ -68,7 +67,7 @@ class NdpiImage(BaseTiffImage):
     def focal_plane(self) -> float:
         return self._focal_plane
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self.mpp / 1000
 
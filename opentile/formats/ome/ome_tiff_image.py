@@ -19,6 +19,7 @@ from typing import Optional
 import numpy as np
 from tifffile import COMPRESSION, TiffPage
 
+from opentile.cache import cached_property
 from opentile.file import OpenTileFile
 from opentile.formats.ndpi.ndpi_tiler import NdpiOneFrameImage
 from opentile.geometry import Size, SizeMm
@@ -66,7 +67,7 @@ class OmeTiffAssociatedImage(OmeTiffImage, AssociatedTiffImage):
     def mpp(self) -> Optional[SizeMm]:
         return self._mpp
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> Optional[SizeMm]:
         if self.mpp is None:
             return None
@@ -96,7 +97,7 @@ class OmeTiffThumbnailImage(OmeTiffImage, ThumbnailTiffImage):
     def mpp(self) -> SizeMm:
         return self._mpp
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self.mpp / 1000
 
@@ -143,7 +144,7 @@ class OmeTiffOneFrameImage(NdpiOneFrameImage, LevelTiffImage):
     def pyramid_index(self) -> int:
         return self._pyramid_index
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self.mpp / 1000
 
@@ -180,7 +181,7 @@ class OmeTiffTiledImage(NativeTiledTiffImage, LevelTiffImage):
     def mpp(self) -> SizeMm:
         return self._mpp
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self.mpp / 1000
 
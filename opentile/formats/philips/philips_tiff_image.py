@@ -14,10 +14,13 @@
 
 """Image implementation for Philips tiff files."""
 
+import threading
+from collections.abc import Iterator, Sequence
 from typing import Optional
 
 from tifffile import COMPRESSION, TiffPage
 
+from opentile.cache import cached_property
 from opentile.file import OpenTileFile
 from opentile.geometry import Size, SizeMm
 from opentile.jpeg import Jpeg
@@ -28,6 +31,12 @@ from opentile.tiff_image import (
     ThumbnailTiffImage,
 )
 
+# Blank tiles shared between pages (and files) with the same tile geometry,
+# subsampling and jpeg tables, so the fill transform runs once per unique
+# tile layout instead of once per pyramid level.
+_blank_tile_cache: dict[tuple[int, int, Optional[tuple[int, int]], bytes], bytes] = {}
+_blank_tile_cache_lock = threading.Lock()
+
 
 class PhilipsAssociatedTiffImage(NativeTiledTiffImage, AssociatedTiffImage):
     def __repr__(self) -> str:
@@ -66,7 +75,7 @@ class PhilipsThumbnailTiffImage(NativeTiledTiffImage, ThumbnailTiffImage):
     def scale(self) -> float:
         return self._scale
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self._mpp / 1000
 
@@ -106,7 +115,6 @@ class PhilipsLevelTiffImage(NativeTiledTiffImage, LevelTiffImage):
         self._scale = self._calculate_scale(base_size)
         self._pyramid_index = self._calculate_pyramidal_index(self._scale)
         self._mpp = self._calculate_mpp(self._base_mpp, self._scale)
-        self._blank_tile = self._create_blank_tile()
 
     def __repr__(self) -> str:
         return (
@@ -119,7 +127,7 @@ class PhilipsLevelTiffImage(NativeTiledTiffImage, LevelTiffImage):
         """Handling of sparse tiles assumes JPEG compression."""
         return [COMPRESSION.JPEG]
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self.mpp / 1000
 
@@ -135,10 +143,48 @@ class PhilipsLevelTiffImage(NativeTiledTiffImage, LevelTiffImage):
     def pyramid_index(self) -> int:
         return self._pyramid_index
 
-    @property
+    @cached_property
     def blank_tile(self) -> bytes:
-        """Return blank tile."""
-        return self._blank_tile
+        """Return blank tile, computed on first use and shared between pages
+        with the same tile geometry, subsampling and jpeg tables."""
+        jpegtables = self._page.jpegtables
+        if jpegtables is None:
+            # Without shared tables there is no safe cross-page cache key.
+            return self._create_blank_tile()
+        key = (
+            self.tile_size.width,
+            self.tile_size.height,
+            self._page.subsampling,
+            jpegtables,
+        )
+        with _blank_tile_cache_lock:
+            blank_tile = _blank_tile_cache.get(key)
+        if blank_tile is None:
+            blank_tile = self._create_blank_tile()
+            with _blank_tile_cache_lock:
+                _blank_tile_cache[key] = blank_tile
+        return blank_tile
+
+    def get_tile(self, tile_position: tuple[int, int]) -> bytes:
+        frame_index = self._tile_position_to_frame_index(tile_position)
+        if self._frame_is_sparse(frame_index):
+            # The blank tile is already a complete frame; return it as is.
+            return self.blank_tile
+        return super().get_tile(tile_position)
+
+    def get_tiles(self, tile_positions: Sequence[tuple[int, int]]) -> Iterator[bytes]:
+        if any(
+            self._frame_is_sparse(self._tile_position_to_frame_index(tile_position))
+            for tile_position in tile_positions
+        ):
+            return (self.get_tile(tile_position) for tile_position in tile_positions)
+        return super().get_tiles(tile_positions)
+
+    def _frame_is_sparse(self, index: int) -> bool:
+        """Return true if frame at index is sparse (no stored data)."""
+        return (
+            index >= self._frame_bytecounts.size or self._frame_bytecounts[index] == 0
+        )
 
     def _create_blank_tile(self, luminance: float = 1.0) -> bytes:
         """Create a blank tile from a valid tile. Uses the first found
@@ -157,20 +203,11 @@ class PhilipsLevelTiffImage(NativeTiledTiffImage, LevelTiffImage):
 
         """
         # Todo, figure out what color to fill with.
-        try:
-            # Get first frame in page that is not 0 bytes
-            valid_frame_index = next(
-                index
-                for index, datalength in enumerate(self._page.databytecounts)
-                if datalength != 0
-            )
-        except StopIteration as exception:
-            raise ValueError("Could not find valid frame in image.") from exception
-        tile = self._read_frame(valid_frame_index)
-        if self._page.jpegtables is not None:
-            prefix, scan_offset = Jpeg.calculate_prefix_and_scan_offset(
-                tile, self._page.jpegtables, False
-            )
+        # Get first frame in page that is not 0 bytes
+        tile = self._reference_frame
+        prefix_and_scan_offset = self._prefix_and_scan_offset
+        if prefix_and_scan_offset is not None:
+            prefix, scan_offset = prefix_and_scan_offset
             tile = Jpeg.add_jpeg_prefix(prefix, scan_offset, tile)
         tile = self._jpeg.fill_frame(tile, luminance)
         return tile
@@ -191,10 +228,6 @@ class PhilipsLevelTiffImage(NativeTiledTiffImage, LevelTiffImage):
             Frame bytes from frame index or blank tile.
 
         """
-        if (
-            index >= len(self._page.databytecounts)
-            or self._page.databytecounts[index] == 0
-        ):
-            # Sparse tile
+        if self._frame_is_sparse(index):
             return self.blank_tile
         return super()._read_frame(index)
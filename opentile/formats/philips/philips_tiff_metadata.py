@@ -47,17 +47,23 @@ class PhilipsTiffMetadata(Metadata):
     ]
 
     def __init__(self, tiff_file: TiffFile):
+        self._tags: dict[str, Optional[str]] = {tag: None for tag in self.TAGS}
         if tiff_file.philips_metadata is None:
             return
 
         metadata = ElementTree.fromstring(tiff_file.philips_metadata)
-        self._tags: dict[str, Optional[str]] = {tag: None for tag in self.TAGS}
+        remaining = set(self._tags)
         for element in metadata.iter("Attribute"):
             if element.text is None:
                 continue
-            name = element.attrib["Name"]
-            if name in self._tags and self._tags[name] is None:
+            name = element.attrib.get("Name")
+            if name in remaining:
                 self._tags[name] = element.text
+                remaining.discard(name)
+                if not remaining:
+                    # All tags found; skip the rest of the tree (the bulk of
+                    # the Philips metadata is per-tile data).
+                    break
 
     @property
     def scanner_manufacturer(self) -> Optional[str]:
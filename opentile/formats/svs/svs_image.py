@@ -23,6 +23,7 @@ from PIL import Image
 from tifffile import COMPRESSION, PHOTOMETRIC, TiffPage
 from tifffile.tifffile import svs_description_metadata
 
+from opentile.cache import cached_property
 from opentile.file import OpenTileFile
 from opentile.geometry import Point, Region, Size, SizeMm
 from opentile.jpeg import Jpeg
@@ -113,7 +114,7 @@ class SvsThumbnailImage(SvsStripedImage, ThumbnailTiffImage):
     def mpp(self) -> SizeMm:
         return self._mpp
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self.mpp / 1000
 
@@ -212,7 +213,7 @@ class SvsTiledImage(NativeTiledTiffImage, LevelTiffImage):
             f"{self._base_size}, {self._base_mpp})"
         )
 
-    @property
+    @cached_property
     def pixel_spacing(self) -> SizeMm:
         return self.mpp / 1000
 
@@ -280,7 +281,7 @@ class SvsTiledImage(NativeTiledTiffImage, LevelTiffImage):
         """
         for tile in edge.iterate_all():
             frame_index = self._tile_point_to_frame_index(tile)
-            if self._page.databytecounts[frame_index] == 0:
+            if self._frame_bytecounts[frame_index] == 0:
                 return True
         return False
 
@@ -335,7 +336,7 @@ class SvsTiledImage(NativeTiledTiffImage, LevelTiffImage):
         """
         if self._parent is None:
             raise ValueError("No parent level to get tiles from")
-        scale = int(pow(2, self.pyramid_index - self._parent.pyramid_index))
+        scale = 1 << (self.pyramid_index - self._parent.pyramid_index)
         scaled_tile_region = Region(tile_point, Size(1, 1)) * scale
 
         # Get decoded tiles
@@ -18,6 +18,7 @@ import os
 import platform
 from collections.abc import Iterator, Sequence
 from ctypes.util import find_library
+from functools import cache
 from pathlib import Path
 from struct import pack, unpack
 from typing import Optional, Union
@@ -65,6 +66,20 @@ def find_turbojpeg_path() -> Path:
     )
 
 
+@cache
+def _load_turbo_jpeg(turbo_path: str) -> TurboJPEG:
+    """Return the TurboJPEG instance for the library path, loading the library
+    once per path instead of once per opened file."""
+    return TurboJPEG(turbo_path)
+
+
+@cache
+def _load_jpeg_filler(turbo_path: str) -> JpegFiller:
+    """Return the JpegFiller for the library path, loading the library once
+    per path instead of once per opened file."""
+    return JpegFiller(turbo_path)
+
+
 class JpegTagNotFound(Exception):
     """Raised when expected Jpeg tag was not found."""
 
@@ -91,12 +106,24 @@ class Jpeg:
         "restart mark": 0xD0,
     }
 
+    # Tag bytes precomputed from TAGS so the per-frame and per-fragment
+    # helpers return constants instead of building 1-2 byte objects per call.
+    _START_OF_FRAME = bytes([TAGS["tag marker"], TAGS["start of frame"]])
+    _START_OF_SCAN = bytes([TAGS["tag marker"], TAGS["start of scan"]])
+    _END_OF_IMAGE = bytes([TAGS["tag marker"], TAGS["end of image"]])
+    _RESTART_INTERVAL = bytes([TAGS["tag marker"], TAGS["restart interval"]])
+    _RESTART_MARKS = tuple(
+        bytes([mark]) for mark in range(TAGS["restart mark"], TAGS["restart mark"] + 8)
+    )
+
     def __init__(self, turbo_path: Optional[Union[str, Path]] = None) -> None:
         if turbo_path is None:
             turbo_path = find_turbojpeg_path()
         turbo_path = str(turbo_path)
-        self._turbo_jpeg = TurboJPEG(turbo_path)
-        self._jpeg_filler = JpegFiller(turbo_path)
+        # The instances are stateless with respect to files (handles are
+        # created per call), so they can be shared between Jpeg instances.
+        self._turbo_jpeg = _load_turbo_jpeg(turbo_path)
+        self._jpeg_filler = _load_jpeg_filler(turbo_path)
 
     def get_mcu(self, frame: bytes) -> Size:
         """Return MCU size read from frame header.
@@ -132,16 +159,19 @@ class Jpeg:
         bytes:
             Concatenated frame in bytes.
         """
-        frame = header
+        parts: list[Union[bytes, memoryview]] = [header]
         for fragment_index, fragment in enumerate(fragments):
             if not (fragment[-2] == Jpeg.TAGS["tag marker"] and fragment[-1] != b"0"):
                 raise JpegTagNotFound(
                     "Tag for end of scan or restart marker not found in scan"
                 )
-            frame += fragment[:-1]  # Do not include restart mark index
-            frame += self.restart_mark(fragment_index)
-        frame += self.end_of_image()
-        return frame
+            # Do not include restart mark index
+            parts.append(memoryview(fragment)[:-1])
+            parts.append(self.restart_mark(fragment_index))
+        parts.append(self.end_of_image())
+        # A single join sizes the output exactly and copies each fragment once,
+        # instead of reallocating the frame for every fragment.
+        return b"".join(parts)
 
     def concatenate_scans(
         self,
@@ -259,7 +289,9 @@ class Jpeg:
         `prefix` and `scan_offset` are identical for every tile of a tiff page,
         so they can be computed once and reused for all tiles.
         """
-        return prefix + bytes(frame[scan_offset:])
+        # Joining through a memoryview sizes the output exactly and copies the
+        # scan data once, instead of slicing it out and concatenating.
+        return b"".join((prefix, memoryview(frame)[scan_offset:]))
 
     # Adobe APP14 marker with transform flag 0 (image is encoded as RGB, not
     # YCbCr).
@@ -329,27 +361,27 @@ class Jpeg:
     @classmethod
     def start_of_frame(cls) -> bytes:
         """Return bytes representing a start of frame tag."""
-        return bytes([cls.TAGS["tag marker"], cls.TAGS["start of frame"]])
+        return cls._START_OF_FRAME
 
     @classmethod
     def start_of_scan(cls) -> bytes:
         """Return bytes representing a start of scan tag."""
-        return bytes([cls.TAGS["tag marker"], cls.TAGS["start of scan"]])
+        return cls._START_OF_SCAN
 
     @classmethod
     def end_of_image(cls) -> bytes:
         """Return bytes representing a end of image tag."""
-        return bytes([cls.TAGS["tag marker"], cls.TAGS["end of image"]])
+        return cls._END_OF_IMAGE
 
     @classmethod
     def restart_mark(cls, index: int) -> bytes:
         """Return bytes representing a restart marker of index (0-7), without
         the prefixing tag (0xFF)."""
-        return bytes([cls.TAGS["restart mark"] + index % 8])
+        return cls._RESTART_MARKS[index % 8]
 
     @classmethod
     def restart_interval(cls) -> bytes:
-        return bytes([cls.TAGS["tag marker"], cls.TAGS["restart interval"]])
+        return cls._RESTART_INTERVAL
 
     @staticmethod
     def code_short(value: int) -> bytes:
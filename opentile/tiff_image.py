@@ -14,11 +14,13 @@
 
 """Base image classes."""
 
+import itertools
 import math
+import threading
 from abc import ABCMeta, abstractmethod
-from collections.abc import Iterator, Sequence
-from functools import cached_property
-from typing import Optional
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from typing import Optional, TypeVar
 
 import numpy as np
 from tifffile import (
@@ -29,10 +31,19 @@ from tifffile import (
 )
 from upath import UPath
 
+from opentile.cache import cached_property
+from opentile.config import settings
 from opentile.file import OpenTileFile
 from opentile.geometry import Point, Region, Size, SizeMm
 from opentile.jpeg import Jpeg
 
+TileType = TypeVar("TileType")
+
+# Marks threads that are running pooled tile work, so that nested tile
+# requests (e.g. fixing a corrupt svs tile from its parent level) run
+# sequentially instead of submitting to the same pool and deadlocking.
+_pool_worker = threading.local()
+
 
 class TiffImage(metaclass=ABCMeta):
     """Abstract class for reading tiles from TiffPage."""
@@ -333,7 +344,6 @@ class BaseTiffImage(TiffImage):
             self._tile_size = Size(self._page.tilewidth, self._page.tilelength)
         else:
             self._tile_size = self.image_size
-        self._tiled_region = Region(position=Point(0, 0), size=self.tiled_size)
 
     def __str__(self) -> str:
         return f"{type(self).__name__} of page {self._page}"
@@ -389,24 +399,85 @@ class BaseTiffImage(TiffImage):
             return Size(1, 1)
         return self.image_size.ceil_div(self.tile_size)
 
+    @cached_property
+    def _tiled_region(self) -> Region:
+        """Region covering all tile positions. Computed on first use so
+        subclass adjustments to the tile size are honoured."""
+        return Region(position=Point(0, 0), size=self.tiled_size)
+
+    @cached_property
+    def _tiled_width(self) -> int:
+        """Tiled width as a plain int, cached for the frame index calculation
+        on the tile hot path."""
+        return self.tiled_size.width
+
+    @cached_property
+    def _frame_offsets(self) -> np.ndarray:
+        """Frame byte offsets as an array. Avoids looking up the page's lazily
+        built offset sequence for every tile."""
+        return np.asarray(self._page.dataoffsets, dtype=np.int64)
+
+    @cached_property
+    def _frame_bytecounts(self) -> np.ndarray:
+        """Frame byte counts as an array. Avoids looking up the page's lazily
+        built byte count sequence for every tile."""
+        return np.asarray(self._page.databytecounts, dtype=np.int64)
+
     @cached_property
     def compressed_size(self) -> int:
-        frames = sum(self._page.databytecounts)
+        frames = int(self._frame_bytecounts.sum())
         if self._page.jpegheader is not None:
             jpeg_header_length = len(self._page.jpegheader)
         elif self._page.jpegtables is not None:
             jpeg_header_length = len(self._page.jpegtables)
         else:
             jpeg_header_length = 0
-        return frames + len(self._page.dataoffsets) * jpeg_header_length
+        return frames + self._frame_offsets.size * jpeg_header_length
 
     def get_tiles(self, tile_positions: Sequence[tuple[int, int]]) -> Iterator[bytes]:
-        return (self.get_tile(tile) for tile in tile_positions)
+        return self._map_tiles(self.get_tile, tile_positions)
 
     def get_decoded_tiles(
         self, tile_positions: Sequence[tuple[int, int]]
     ) -> Iterator[np.ndarray]:
-        return (self.get_decoded_tile(tile) for tile in tile_positions)
+        return self._map_tiles(self.get_decoded_tile, tile_positions)
+
+    def _map_tiles(
+        self,
+        function: Callable[[tuple[int, int]], TileType],
+        tile_positions: Sequence[tuple[int, int]],
+    ) -> Iterator[TileType]:
+        """Produce a tile per position, in request order. Reads through
+        OpenTileFile are thread safe, so tiles are produced concurrently on the
+        file's pool. Calls from a pool worker run sequentially, as submitting
+        nested work from a worker and waiting on it can deadlock once all
+        workers are occupied. At most two tasks per worker are in flight, so a
+        slowly consumed request does not buffer every produced tile."""
+        if len(tile_positions) < 2 or getattr(_pool_worker, "active", False):
+            return (function(tile_position) for tile_position in tile_positions)
+
+        def run(tile_position: tuple[int, int]) -> TileType:
+            _pool_worker.active = True
+            try:
+                return function(tile_position)
+            finally:
+                _pool_worker.active = False
+
+        def producer() -> Iterator[TileType]:
+            pool = self._file.pool
+            window = 2 * settings.tile_worker_threads
+            positions = iter(tile_positions)
+            futures = deque(
+                pool.submit(run, position)
+                for position in itertools.islice(positions, window)
+            )
+            while futures:
+                tile = futures.popleft().result()
+                for position in itertools.islice(positions, 1):
+                    futures.append(pool.submit(run, position))
+                yield tile
+
+        return producer()
 
     def get_all_tiles(self, raw: bool = False) -> Iterator[bytes]:
         if raw:
@@ -438,13 +509,13 @@ class BaseTiffImage(TiffImage):
             Frame bytes.
         """
         return self._file.read(
-            self._page.dataoffsets[index], self._page.databytecounts[index]
+            int(self._frame_offsets[index]), int(self._frame_bytecounts[index])
         )
 
     def _read_frames(self, indices: Sequence[int]) -> list[bytes]:
         return self._file.read_multiple(
             [
-                (self._page.dataoffsets[index], self._page.databytecounts[index])
+                (int(self._frame_offsets[index]), int(self._frame_bytecounts[index]))
                 for index in indices
             ]
         )
@@ -472,14 +543,20 @@ class BaseTiffImage(TiffImage):
         self,
         scale: float,
     ) -> int:
-        float_index = math.log2(scale)
-        index = int(round(float_index))
+        # Pyramid levels are power of two downscales, so the index is the bit
+        # length of the integer scale. Avoids math.log2, which can misround on
+        # exact powers of two.
+        index = max(int(round(scale)), 1).bit_length() - 1
+        power_of_two = 1 << index
+        if (power_of_two << 1) - scale < scale - power_of_two:
+            index += 1
+            power_of_two <<= 1
         TOLERANCE = 1e-2
-        if not math.isclose(float_index, index, abs_tol=TOLERANCE):
+        if not math.isclose(scale, power_of_two, rel_tol=TOLERANCE):
             raise NotImplementedError(
-                f"Pyramid index needs to be integer. Got {float_index} that is "
-                f"more than set"
-                f"tolerance {TOLERANCE} from the closest integer {index}. "
+                f"Pyramid index needs to be integer. Got scale {scale} that is "
+                f"more than set tolerance {TOLERANCE} from the closest power "
+                f"of two {power_of_two}. "
             )
         return index
 
@@ -490,36 +567,71 @@ class BaseTiffImage(TiffImage):
 class NativeTiledTiffImage(BaseTiffImage, metaclass=ABCMeta):
     """Meta class for images that are natively tiled (e.g. not ndpi)"""
 
-    _cached_prefix_and_scan_offset: Optional[tuple[bytes, int]] = None
-
     def get_tile(self, tile_position: tuple[int, int]) -> bytes:
-        tile_point = Point.from_tuple(tile_position)
-        frame_index = self._tile_point_to_frame_index(tile_point)
-        tile = self._read_frame(frame_index)
-        return self._add_jpeg_tables(tile)
+        frame_index = self._tile_position_to_frame_index(tile_position)
+        prefix_and_scan_offset = self._prefix_and_scan_offset
+        if prefix_and_scan_offset is None:
+            return self._read_frame(frame_index)
+        prefix, scan_offset = prefix_and_scan_offset
+        return prefix + self._read_frame_scan(frame_index, scan_offset)
 
     def get_tiles(self, tile_positions: Sequence[tuple[int, int]]) -> Iterator[bytes]:
-        tile_points = [
-            Point.from_tuple(tile_position) for tile_position in tile_positions
-        ]
         frame_indices = [
-            self._tile_point_to_frame_index(tile_point) for tile_point in tile_points
+            self._tile_position_to_frame_index(tile_position)
+            for tile_position in tile_positions
         ]
-        tiles = self._read_frames(frame_indices)
-        return (self._add_jpeg_tables(tile) for tile in tiles)
+        prefix_and_scan_offset = self._prefix_and_scan_offset
+        if prefix_and_scan_offset is None:
+            return iter(self._read_frames(frame_indices))
+        prefix, scan_offset = prefix_and_scan_offset
+        scans = self._read_frame_scans(frame_indices, scan_offset)
+        return (prefix + scan for scan in scans)
 
-    def _add_jpeg_tables(self, tile: bytes) -> bytes:
-        """Prepend jpeg tables (and, for svs, the rgb color space fix) to an
-        abbreviated tile, reusing the page's cached prefix."""
+    @cached_property
+    def _prefix_and_scan_offset(self) -> Optional[tuple[bytes, int]]:
+        """Header prefix and scan data offset shared by all tiles of the page,
+        or None if the page stores complete frames (no jpeg tables). Computed
+        once from a reference frame; tiles are then assembled as
+        `prefix + scan data`, so the replaced frame header bytes before the
+        scan offset never need to be read."""
         jpegtables = self._page.jpegtables
         if jpegtables is None:
-            return tile
-        if self._cached_prefix_and_scan_offset is None:
-            self._cached_prefix_and_scan_offset = Jpeg.calculate_prefix_and_scan_offset(
-                tile, jpegtables, self._add_rgb_colorspace_fix
-            )
-        prefix, scan_offset = self._cached_prefix_and_scan_offset
-        return Jpeg.add_jpeg_prefix(prefix, scan_offset, tile)
+            return None
+        return Jpeg.calculate_prefix_and_scan_offset(
+            self._reference_frame, jpegtables, self._add_rgb_colorspace_fix
+        )
+
+    @cached_property
+    def _reference_frame(self) -> bytes:
+        """A frame whose header is representative for all frames of the page
+        (the first frame with stored data). Cached so users of the reference
+        frame (prefix calculation, blank tile construction) share one read."""
+        valid_frame_indices = np.flatnonzero(self._frame_bytecounts)
+        if valid_frame_indices.size == 0:
+            raise ValueError("Could not find valid frame in image.")
+        return BaseTiffImage._read_frame(self, int(valid_frame_indices[0]))
+
+    def _read_frame_scan(self, index: int, scan_offset: int) -> bytes:
+        """Read only the scan data of the frame at index, skipping the header
+        bytes that the cached prefix replaces."""
+        return self._file.read(
+            int(self._frame_offsets[index]) + scan_offset,
+            int(self._frame_bytecounts[index]) - scan_offset,
+        )
+
+    def _read_frame_scans(
+        self, indices: Sequence[int], scan_offset: int
+    ) -> list[bytes]:
+        """Read only the scan data of the frames at indices."""
+        return self._file.read_multiple(
+            [
+                (
+                    int(self._frame_offsets[index]) + scan_offset,
+                    int(self._frame_bytecounts[index]) - scan_offset,
+                )
+                for index in indices
+            ]
+        )
 
     def get_decoded_tile(self, tile_position: tuple[int, int]) -> np.ndarray:
         tile_point = Point.from_tuple(tile_position)
@@ -535,12 +647,17 @@ class NativeTiledTiffImage(BaseTiffImage, metaclass=ABCMeta):
             )
 
         frame = self.get_tile(tile_position)
-        frame_index = self._tile_point_to_frame_index(tile_point)
+        frame_index = self._tile_position_to_frame_index(tile_position)
         data, _, _ = self._page.decode(frame, frame_index)
         assert isinstance(data, np.ndarray)
         return data.squeeze((0, 3) if self.samples_per_pixel == 1 else 0)
 
+    def _tile_position_to_frame_index(self, tile_position: tuple[int, int]) -> int:
+        """Return linear frame index for tile position. Works on the plain
+        tuple to avoid constructing a Point per tile on the hot path."""
+        x, y = tile_position
+        return y * self._tiled_width + x
+
     def _tile_point_to_frame_index(self, tile_point: Point) -> int:
-        """Return linear frame index for tile position."""
-        frame_index = tile_point.y * self.tiled_size.width + tile_point.x
-        return frame_index
+        """Return linear frame index for tile point."""
+        return tile_point.y * self._tiled_width + tile_point.x
@@ -15,14 +15,14 @@
 """Base tiler class."""
 
 from abc import ABCMeta, abstractmethod
-from functools import cached_property
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Any, Optional, Union
 
 from tifffile import TiffFile, TiffFrame, TiffPage, TiffPageSeries
 from upath import UPath
 
-from opentile.cache import lru_cached_method
+from opentile.cache import cached_property, lru_cached_method
 from opentile.file import OpenTileFile
 from opentile.geometry import Size
 from opentile.metadata import Metadata
@@ -31,6 +31,7 @@ from opentile.tiff_image import (
     AssociatedTiffImage,
     LevelTiffImage,
     ThumbnailTiffImage,
+    TiffImage,
 )
 
 
@@ -57,30 +58,67 @@ class Tiler(metaclass=ABCMeta):
             self._file = file
         else:
             self._file = OpenTileFile(file, file_options)
-        self._level_series_index = 0
-        self._overview_series_index: Optional[int] = None
-        self._label_series_index: Optional[int] = None
-        self._thumbnail_series_index: Optional[int] = None
+        self._icc_profile: Optional[bytes] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @cached_property
+    def _series_indices(
+        self,
+    ) -> tuple[int, Optional[int], Optional[int], Optional[int]]:
+        """Classify series as level, overview, label, and thumbnail series.
+        Classifying forces tifffile to parse each series' first page, so it is
+        deferred to first access instead of done at file open."""
+        level_series_index = 0
+        overview_series_index: Optional[int] = None
+        label_series_index: Optional[int] = None
+        thumbnail_series_index: Optional[int] = None
         for series_index, series in enumerate(self._file.series):
             if self._is_level_series(series):
-                self._level_series_index = series_index
+                level_series_index = series_index
             if self._is_label_series(series):
-                self._label_series_index = series_index
+                label_series_index = series_index
             elif self._is_overview_series(series):
-                self._overview_series_index = series_index
+                overview_series_index = series_index
             elif self._is_thumbnail_series(series):
-                self._thumbnail_series_index = series_index
-        self._icc_profile: Optional[bytes] = None
+                thumbnail_series_index = series_index
+        return (
+            level_series_index,
+            overview_series_index,
+            label_series_index,
+            thumbnail_series_index,
+        )
+
+    @property
+    def _level_series_index(self) -> int:
+        return self._series_indices[0]
+
+    @property
+    def _overview_series_index(self) -> Optional[int]:
+        return self._series_indices[1]
+
+    @property
+    def _label_series_index(self) -> Optional[int]:
+        return self._series_indices[2]
+
+    @property
+    def _thumbnail_series_index(self) -> Optional[int]:
+        return self._series_indices[3]
+
+    @cached_property
+    def _base_page(self) -> TiffPage:
+        """First page of the level series."""
         base_page = self._file.series[self._level_series_index].pages[0]
         assert isinstance(base_page, TiffPage)
-        self._base_page = base_page
-        self._base_size = Size(self._base_page.imagewidth, self._base_page.imagelength)
-
-    def __enter__(self):
-        return self
+        return base_page
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    @cached_property
+    def _base_size(self) -> Size:
+        return Size(self._base_page.imagewidth, self._base_page.imagelength)
 
     @cached_property
     def levels(self) -> list[LevelTiffImage]:
@@ -289,15 +327,52 @@ class Tiler(metaclass=ABCMeta):
         bytes
             Tile at position.
         """
+        return self._get_image(series, level, page).get_tile(tile_position)
+
+    def get_tiles(
+        self, tiles: Sequence[tuple[int, int, int, tuple[int, int]]]
+    ) -> Iterator[bytes]:
+        """Return iterator of image bytes for tiles across images.
+
+        Tiles are grouped per image so that frames for each image can be
+        read together, and duplicated tile positions are only read once.
+        Tiles are returned in the requested order.
+
+        Parameters
+        ----------
+        tiles: Sequence[Tuple[int, int, int, Tuple[int, int]]]
+            Tiles to get, specified as series, level, page, and tile position.
+
+        Returns
+        ----------
+        Iterator[bytes]
+            Iterator of tiles in requested order.
+        """
+        grouped: dict[tuple[int, int, int], list[tuple[int, int]]] = {}
+        for series, level, page, tile_position in tiles:
+            grouped.setdefault((series, level, page), []).append(tile_position)
+        fetched: dict[tuple[int, int, int, tuple[int, int]], bytes] = {}
+        for (series, level, page), tile_positions in grouped.items():
+            unique_positions = list(dict.fromkeys(tile_positions))
+            image = self._get_image(series, level, page)
+            for tile_position, tile in zip(
+                unique_positions, image.get_tiles(unique_positions)
+            ):
+                fetched[series, level, page, tile_position] = tile
+        return (
+            fetched[series, level, page, tile_position]
+            for series, level, page, tile_position in tiles
+        )
+
+    def _get_image(self, series: int, level: int, page: int) -> TiffImage:
+        """Return image for series, level, page."""
         if series == self._level_series_index:
-            image = self.get_level(level, page)
-        elif series == self._overview_series_index:
-            image = self.get_overview(page)
-        elif series == self._label_series_index:
-            image = self.get_label(page)
-        else:
-            raise ValueError("Unknown series.")
-        return image.get_tile(tile_position)
+            return self.get_level(level, page)
+        if series == self._overview_series_index:
+            return self.get_overview(page)
+        if series == self._label_series_index:
+            return self.get_label(page)
+        raise ValueError("Unknown series.")
 
     def _get_tiff_page(self, series: int, level: int, page: int) -> TiffPage:
         """Return TiffPage for series, level, page."""
@@ -0,0 +1,67 @@
+#    Copyright 2026 SECTRA AB
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import pytest
+
+from opentile.file import BufferPool
+
+
+@pytest.mark.unittest
+class TestBufferPool:
+    def test_acquire_returns_buffer_of_at_least_requested_size(self):
+        # Arrange
+        pool = BufferPool()
+
+        # Act
+        buffer = pool.acquire(1000)
+
+        # Assert
+        assert len(buffer) >= 1000
+
+    def test_released_buffer_is_reused_for_matching_size(self):
+        # Arrange
+        pool = BufferPool()
+        buffer = pool.acquire(1000)
+        pool.release(buffer)
+
+        # Act
+        reacquired = pool.acquire(1000)
+
+        # Assert
+        assert reacquired is buffer
+
+    def test_smaller_request_in_same_bucket_reuses_buffer(self):
+        # Arrange -- 600 and 1000 both round up to the 1024 bucket
+        pool = BufferPool()
+        buffer = pool.acquire(1000)
+        pool.release(buffer)
+
+        # Act
+        reacquired = pool.acquire(600)
+
+        # Assert
+        assert reacquired is buffer
+
+    def test_bucket_is_bounded(self):
+        # Arrange
+        pool = BufferPool()
+        buffers = [pool.acquire(1000) for _ in range(BufferPool._MAX_PER_BUCKET + 1)]
+
+        # Act
+        for buffer in buffers:
+            pool.release(buffer)
+
+        # Assert -- the overflowing buffer was dropped, not pooled
+        bucket = pool._buckets[len(buffers[0])]
+        assert len(bucket) == BufferPool._MAX_PER_BUCKET
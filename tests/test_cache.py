@@ -17,7 +17,7 @@ import weakref
 
 import pytest
 
-from opentile.cache import lru_cached_method
+from opentile.cache import cached_property, lru_cached_method
 
 
 @pytest.mark.unittest
@@ -154,3 +154,66 @@ class TestLruCachedMethod:
 
         # Assert
         assert reference() is None
+
+
+@pytest.mark.unittest
+class TestCachedProperty:
+    def test_computes_once_per_instance(self):
+        # Arrange
+        calls: list[int] = []
+
+        class Example:
+            @cached_property
+            def value(self):
+                calls.append(1)
+                return object()
+
+        example = Example()
+
+        # Act
+        first = example.value
+        second = example.value
+
+        # Assert
+        assert first is second
+        assert calls == [1]
+
+    def test_separate_instances_have_separate_values(self):
+        # Arrange
+        class Example:
+            @cached_property
+            def value(self):
+                return object()
+
+        first_instance = Example()
+        second_instance = Example()
+
+        # Act & Assert
+        assert first_instance.value is not second_instance.value
+
+    def test_class_access_returns_descriptor(self):
+        # Arrange
+        class Example:
+            @cached_property
+            def value(self):
+                return object()
+
+        # Act & Assert
+        assert isinstance(Example.value, cached_property)
+
+    def test_cached_value_can_be_invalidated(self):
+        # Arrange -- same contract as functools.cached_property
+        class Example:
+            @cached_property
+            def value(self):
+                return object()
+
+        example = Example()
+        first = example.value
+
+        # Act
+        del example.__dict__["value"]
+        second = example.value
+
+        # Assert
+        assert second is not first
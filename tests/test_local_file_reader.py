@@ -0,0 +1,121 @@
+#    Copyright 2026 SECTRA AB
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from opentile.config import settings
+from opentile.file import LocalFileReader
+
+DATA = bytes(range(256)) * 1024  # 256 KiB
+
+
+@pytest.fixture
+def data_file(tmp_path: Path) -> Path:
+    file = tmp_path / "data.bin"
+    file.write_bytes(DATA)
+    return file
+
+
+@pytest.fixture(params=[True, False], ids=["mmap", "pread"])
+def reader(
+    data_file: Path, request: pytest.FixtureRequest
+) -> Iterator[LocalFileReader]:
+    original_use_memory_mapping = settings.use_memory_mapping
+    settings.use_memory_mapping = request.param
+    reader = LocalFileReader(str(data_file))
+    yield reader
+    reader.close()
+    settings.use_memory_mapping = original_use_memory_mapping
+
+
+@pytest.mark.unittest
+class TestLocalFileReader:
+    def test_read(self, reader: LocalFileReader):
+        # Act
+        result = reader.read(1000, 100)
+
+        # Assert
+        assert result == DATA[1000:1100]
+
+    def test_read_multiple_returns_frames_in_request_order(
+        self, reader: LocalFileReader
+    ):
+        # Arrange -- out of offset order
+        requests = [(5000, 100), (1000, 100), (3000, 100)]
+
+        # Act
+        result = reader.read_multiple(requests)
+
+        # Assert
+        assert result == [
+            DATA[offset : offset + bytecount] for offset, bytecount in requests
+        ]
+
+    def test_read_multiple_contiguous_frames(self, reader: LocalFileReader):
+        # Arrange
+        requests = [(1000, 100), (1100, 100), (1200, 100)]
+
+        # Act
+        result = reader.read_multiple(requests)
+
+        # Assert
+        assert result == [
+            DATA[offset : offset + bytecount] for offset, bytecount in requests
+        ]
+
+    def test_read_multiple_frames_with_small_gaps(self, reader: LocalFileReader):
+        # Arrange -- gaps below the coalesce threshold
+        requests = [(1000, 100), (1300, 100), (2000, 100)]
+
+        # Act
+        result = reader.read_multiple(requests)
+
+        # Assert
+        assert result == [
+            DATA[offset : offset + bytecount] for offset, bytecount in requests
+        ]
+
+    def test_read_multiple_duplicated_frame(self, reader: LocalFileReader):
+        # Arrange
+        requests = [(1000, 100), (1000, 100)]
+
+        # Act
+        result = reader.read_multiple(requests)
+
+        # Assert
+        assert result == [DATA[1000:1100], DATA[1000:1100]]
+
+    def test_small_gaps_are_coalesced_into_one_run(self):
+        # Arrange
+        requests = [(0, 100), (200, 100), (300, 100)]
+
+        # Act
+        runs = LocalFileReader._coalesced_runs(requests)
+
+        # Assert
+        assert runs == [[0, 1, 2]]
+
+    def test_large_gaps_start_a_new_run(self):
+        # Arrange
+        gap = LocalFileReader._MAX_COALESCE_GAP + 1
+        requests = [(0, 100), (100 + gap, 100)]
+
+        # Act
+        runs = LocalFileReader._coalesced_runs(requests)
+
+        # Assert
+        assert runs == [[0], [1]]
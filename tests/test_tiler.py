@@ -0,0 +1,89 @@
+#    Copyright 2026 SECTRA AB
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from collections.abc import Iterator, Sequence
+
+import pytest
+
+from opentile.tiler import Tiler
+
+
+class FakeImage:
+    """Image stub returning identifiable tile bytes and recording requests."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self.requested_positions: list[list[tuple[int, int]]] = []
+
+    def get_tiles(self, tile_positions: Sequence[tuple[int, int]]) -> Iterator[bytes]:
+        self.requested_positions.append(list(tile_positions))
+        return (f"{self._name}-{x}-{y}".encode() for x, y in tile_positions)
+
+
+class FakeTiler:
+    """Minimal stand-in for Tiler exposing images by (series, level, page)."""
+
+    get_tiles = Tiler.get_tiles
+
+    def __init__(self, images: dict[tuple[int, int, int], FakeImage]):
+        self._images = images
+
+    def _get_image(self, series: int, level: int, page: int) -> FakeImage:
+        return self._images[series, level, page]
+
+
+@pytest.mark.unittest
+class TestTilerGetTiles:
+    def test_tiles_are_returned_in_request_order(self):
+        # Arrange
+        tiler = FakeTiler({(0, 0, 0): FakeImage("image")})
+        tiles = [(0, 0, 0, (1, 0)), (0, 0, 0, (0, 1)), (0, 0, 0, (0, 0))]
+
+        # Act
+        result = list(tiler.get_tiles(tiles))
+
+        # Assert
+        assert result == [b"image-1-0", b"image-0-1", b"image-0-0"]
+
+    def test_duplicated_positions_are_read_once(self):
+        # Arrange
+        image = FakeImage("image")
+        tiler = FakeTiler({(0, 0, 0): image})
+        tiles = [(0, 0, 0, (0, 0)), (0, 0, 0, (1, 0)), (0, 0, 0, (0, 0))]
+
+        # Act
+        result = list(tiler.get_tiles(tiles))
+
+        # Assert -- the duplicate is returned but only requested once
+        assert result == [b"image-0-0", b"image-1-0", b"image-0-0"]
+        assert image.requested_positions == [[(0, 0), (1, 0)]]
+
+    def test_interleaved_images_are_grouped_but_returned_in_request_order(self):
+        # Arrange
+        level = FakeImage("level")
+        overview = FakeImage("overview")
+        tiler = FakeTiler({(0, 0, 0): level, (1, 0, 0): overview})
+        tiles = [
+            (0, 0, 0, (0, 0)),
+            (1, 0, 0, (0, 0)),
+            (0, 0, 0, (1, 0)),
+        ]
+
+        # Act
+        result = list(tiler.get_tiles(tiles))
+
+        # Assert -- one request per image, results interleaved as requested
+        assert result == [b"level-0-0", b"overview-0-0", b"level-1-0"]
+        assert level.requested_positions == [[(0, 0), (1, 0)]]
+        assert overview.requested_positions == [[(0, 0)]]